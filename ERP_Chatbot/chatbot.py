@@ -1,11 +1,18 @@
 import os
-import json
 import re
 import calendar
-import requests
-import threading
+import asyncio
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from flask import Flask, request, jsonify
+
+import faiss
+import httpx
+import numpy as np
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from dotenv import load_dotenv
 
 # ==============================================
@@ -18,38 +25,85 @@ BACKEND_TOKEN = os.getenv("BACKEND_TOKEN")
 LEAVE_BASE_URL = os.getenv("LEAVE_BASE_URL", "https://your-backend-url.com/api/model_new/save")
 CLOCK_BASE_URL = os.getenv("CLOCK_BASE_URL", "https://your-backend-url.com/api/model/save")
 
-app = Flask(__name__)
-_sessions_lock = threading.Lock()
-user_sessions = {}
+app = FastAPI(title="ERP Chatbot", default_response_class=ORJSONResponse)
+
+# orjson is a C implementation, several times faster than stdlib json on both
+# encode and decode; everything on the hot path routes through these.
+def _dumps(obj):
+    return orjson.dumps(obj).decode()
+
+
+_loads = orjson.loads
+
+class ChatRequest(BaseModel):
+    """Request body for the chat endpoint"""
+    message: str = ""
+    user_id: str = "anon"
+
 
 # ==============================================
-#  Authorization Helper
+#  Pooled Async HTTP Client
 # ==============================================
-def _auth_headers():
-    return {"Authorization": f"Bearer {BACKEND_TOKEN}", "Content-Type": "application/json"}
+# One shared client keeps TCP+TLS connections alive between calls instead of
+# paying a fresh handshake on every OpenAI/backend request, and lets the
+# OpenAI and backend round-trips run concurrently.
+_HTTPX = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+    timeout=15.0,
+)
+
+
+@app.on_event("startup")
+async def _prewarm_connections():
+    """Open keep-alive connections to OpenAI and the backend before first use."""
+    for url in ("https://api.openai.com", LEAVE_BASE_URL, CLOCK_BASE_URL):
+        try:
+            await _HTTPX.head(url, timeout=3)
+        except Exception:
+            pass
+
+
+@app.on_event("shutdown")
+async def _close_http_client():
+    await _HTTPX.aclose()
+
+# ==============================================
+#  Authorization Headers
+# ==============================================
+# Built once at import; these are constants on the per-turn critical path.
+_AUTH_HEADERS = {"Authorization": f"Bearer {BACKEND_TOKEN}", "Content-Type": "application/json"}
+_OPENAI_HEADERS = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
+
+for _name, _value in (("OPENAI_API_KEY", OPENAI_API_KEY), ("BACKEND_TOKEN", BACKEND_TOKEN)):
+    if not _value:
+        print(f"[Config Warning]: {_name} is not set")
 
 
 # ==============================================
 #  Short GPT Response Generator
 # ==============================================
-def get_openai_response(payload_data: dict, feature_name: str = "Request") -> str:
+def _openai_content(resp_bytes):
+    """Decode a completion envelope once and return the message content."""
+    return _loads(resp_bytes)["choices"][0]["message"]["content"]
+
+
+async def get_openai_response(payload_data: dict, feature_name: str = "Request") -> str:
     """Summarize backend response or payload into a concise line."""
-    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
     prompt = (
         f"You are an ERP chatbot. Summarize this {feature_name} in one short sentence "
-        f"(max 14 words). Respond only with plain text.\n\n{json.dumps(payload_data, indent=2)}"
+        f"(max 14 words). Respond only with plain text, no surrounding whitespace.\n\n{_dumps(payload_data)}"
     )
     payload = {
         "model": "gpt-4o-mini",
         "messages": [{"role": "user", "content": prompt}],
         "temperature": 0.2,
-        "max_tokens": 40,
+        "max_tokens": 24,
     }
 
     try:
-        resp = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload, timeout=10)
+        resp = await _HTTPX.post("https://api.openai.com/v1/chat/completions", headers=_OPENAI_HEADERS, json=payload, timeout=10)
         resp.raise_for_status()
-        return resp.json()["choices"][0]["message"]["content"].strip()
+        return _openai_content(resp.content)
     except Exception:
         return f"{feature_name} processed."
 
@@ -57,6 +111,29 @@ def get_openai_response(payload_data: dict, feature_name: str = "Request") -> st
 # ==============================================
 #  Intent + Entity Extraction Logic
 # ==============================================
+# Hot-path patterns and lookup tables, built once at import.
+_WEEKDAYS = {d.lower(): i for i, d in enumerate(calendar.day_name)}
+_WEEKDAY_RE = re.compile(r"(next\s+)?(" + "|".join(_WEEKDAYS) + r")")
+_ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_RELATIVE_OFFSETS = {"today": 0, "tomorrow": 1, "day after tomorrow": 2}
+
+# Minimal schema instruction for the intent call: prompt and completion size
+# both feed straight into OpenAI latency, so keep this terse and rely on JSON
+# mode instead of few-shot scaffolding.
+_INTENT_SCHEMA_PROMPT = (
+    "Extract intent and entities for an ERP chatbot. Reply with a JSON object "
+    "using only these keys (omit ones that do not apply): intent "
+    "(apply_leave|view_leave_status|clock_in_out|unknown), leave_type, "
+    "start_date, end_date, reason, date, time, request_type, short_message. "
+    "For actionable intents, short_message is a confirmation for the user, "
+    "max 14 words. "
+    'Example: "I need sick leave from 2025-10-10 to 2025-10-12 due to fever." -> '
+    '{"intent":"apply_leave","leave_type":"sick","start_date":"2025-10-10",'
+    '"end_date":"2025-10-12","reason":"fever",'
+    '"short_message":"Sick leave requested from 2025-10-10 to 2025-10-12."}'
+)
+
+
 def normalize_relative_date(text, ref_date=None):
     """Convert relative dates like 'tomorrow' or 'next monday' into ISO format."""
     if not text:
@@ -64,25 +141,21 @@ def normalize_relative_date(text, ref_date=None):
     t = text.strip().lower()
     ref = ref_date or datetime.utcnow().date()
 
-    if t in ("today",):
-        return ref.isoformat()
-    if t in ("tomorrow",):
-        return (ref + timedelta(days=1)).isoformat()
-    if t in ("day after tomorrow",):
-        return (ref + timedelta(days=2)).isoformat()
+    offset = _RELATIVE_OFFSETS.get(t)
+    if offset is not None:
+        return (ref + timedelta(days=offset)).isoformat()
 
-    weekdays = {d.lower(): i for i, d in enumerate(calendar.day_name)}
-    m = re.match(r"(next\s+)?(" + "|".join(weekdays.keys()) + r")", t)
+    m = _WEEKDAY_RE.match(t)
     if m:
         next_word, weekday = m.groups()
-        target_idx = weekdays[weekday]
+        target_idx = _WEEKDAYS[weekday]
         curr_idx = ref.weekday()
         days_ahead = (target_idx - curr_idx) % 7
         if days_ahead == 0 and next_word:
             days_ahead = 7
         return (ref + timedelta(days=days_ahead)).isoformat()
 
-    iso_match = re.search(r"(\d{4}-\d{2}-\d{2})", text)
+    iso_match = _ISO_DATE_RE.search(text)
     if iso_match:
         return iso_match.group(1)
 
@@ -105,56 +178,284 @@ def fallback_extract(ai_json, user_message):
     return ai_json
 
 
-def analyze_user_message(user_message):
-    """Use GPT to detect intent and extract relevant entities."""
-    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
+# ==============================================
+#  Semantic Intent Cache
+# ==============================================
+# Near-identical phrasings ("show my leaves" / "what are my pending leaves")
+# share one GPT extraction: queries are embedded once and matched against
+# previous results by cosine similarity. Only entity-free, read-only intents
+# are cached — "sick leave 2025-10-10 for fever" and "sick leave 2025-11-03
+# for surgery" embed well above the threshold, and a near-match must never
+# hand one user's dates or reason to another's state-changing request.
+_SEMANTIC_CACHEABLE_INTENTS = {"view_leave_status"}
+_EMBED_DIM = 1536
+_INTENT_CACHE_SIM = 0.9
+_INTENT_CACHE_TTL = 300.0
+_INTENT_CACHE_MAX = 1000
+_INTENT_CACHE_MAX_QUERY_LEN = 140
+_intent_cache = faiss.IndexFlatIP(_EMBED_DIM)
+_intent_cache_entries = []  # (embedding, ai_data, timestamp), parallel to index rows
+
+# Exact-string memo in front of _embed so identical messages ("clock in",
+# "show my pending leaves") are never re-embedded within a session. This is
+# lru_cache semantics done by hand because _embed is a coroutine; the cache
+# is process-local and cleared on restart.
+_EMBED_MEMO_MAX = 2048
+_embed_memo = {}
+
+
+async def _embed(text):
+    """Embed text with text-embedding-3-small, L2-normalized; None on failure."""
+    text = text.strip().lower()
+    memo_hit = _embed_memo.get(text)
+    if memo_hit is not None:
+        return memo_hit
+
+    try:
+        resp = await _HTTPX.post(
+            "https://api.openai.com/v1/embeddings",
+            headers=_OPENAI_HEADERS,
+            json={"model": "text-embedding-3-small", "input": text},
+            timeout=10,
+        )
+        resp.raise_for_status()
+        vec = np.array(_loads(resp.content)["data"][0]["embedding"], dtype="float32")
+    except Exception as e:
+        print(f"[Embedding Error]: {e}")
+        return None
+    norm = np.linalg.norm(vec)
+    if norm:
+        vec /= norm
+    if len(_embed_memo) >= _EMBED_MEMO_MAX:
+        _embed_memo.pop(next(iter(_embed_memo)))
+    _embed_memo[text] = vec
+    return vec
+
+
+def _intent_cache_lookup(vec):
+    """Return a cached extraction for the closest query, or None."""
+    if _intent_cache.ntotal == 0:
+        return None
+    D, I = _intent_cache.search(vec.reshape(1, -1), 1)
+    if D[0][0] >= _INTENT_CACHE_SIM:
+        _, ai_data, ts = _intent_cache_entries[I[0][0]]
+        if time.time() - ts <= _INTENT_CACHE_TTL:
+            return dict(ai_data)
+    return None
 
-    few_shot_examples = """
-    User: I need sick leave from 2025-10-10 to 2025-10-12 due to fever.
-    JSON: {"intent":"apply_leave","leave_type":"sick","start_date":"2025-10-10","end_date":"2025-10-12","reason":"fever"}
 
-    User: Please mark me clocked in today at 09:15 because I forgot to punch in.
-    JSON: {"intent":"clock_in_out","request_type":"Clock-In","date":"today","time":"09:15","reason":"forgot to punch in"}
+def _intent_cache_add(vec, ai_data):
+    """Store an entity-free extraction, evicting the oldest past the cap.
 
-    User: Show my pending leaves
-    JSON: {"intent":"view_leave_status"}
+    Extractions carrying entities (dates, times, reasons) are never cached:
+    serving them on a near-match would drive backend writes with another
+    query's payload.
     """
+    global _intent_cache_entries
+    if ai_data.get("intent") not in _SEMANTIC_CACHEABLE_INTENTS:
+        return
+    if len(_intent_cache_entries) >= _INTENT_CACHE_MAX:
+        _intent_cache_entries = _intent_cache_entries[-(_INTENT_CACHE_MAX - 1):]
+        _intent_cache.reset()
+        _intent_cache.add(np.stack([e[0] for e in _intent_cache_entries]))
+    _intent_cache.add(vec.reshape(1, -1))
+    _intent_cache_entries.append((vec, dict(ai_data), time.time()))
+
+
+# Compiled once at module load; fast_intent runs these before any GPT call.
+_LEAVE_TYPE_RE = re.compile(r"\b(sick|casual|earned)\s+leave\b")
+_CLOCK_RE = re.compile(r"\bclock[\s-]?(in|out)\b")
+_STATUS_RE = re.compile(r"\b(?:pending|my)\s+leaves?\b|\bleave\s+status\b")
+_TIME_RE = re.compile(r"\b(\d{1,2}[:h]\d{2})\b")
+_REASON_RE = re.compile(r"\b(?:because|due to|reason[:\s]+)\s*(.+?)\s*$")
+_DATE_WORDS_RE = re.compile(
+    r"\b(\d{4}-\d{2}-\d{2}|day after tomorrow|today|tomorrow|(?:next\s+)?(?:"
+    + "|".join(_WEEKDAYS)
+    + r"))\b"
+)
+
+
+def _extract_dates(msg):
+    """Pull date-like phrases (ISO or relative) in order of appearance."""
+    return [m.group(1) for m in _DATE_WORDS_RE.finditer(msg)]
+
+
+def fast_intent(user_message):
+    """Classify the common deterministic queries locally, without a GPT call.
+
+    Returns a dict with the same schema as analyze_user_message, or
+    {"intent": "unknown"} when the message needs the LLM (ambiguous phrasing
+    or required fields the regexes could not recover).
+    """
+    msg = user_message.lower().strip()
+    dates = _extract_dates(msg)
+
+    clock = _CLOCK_RE.search(msg)
+    if clock:
+        time_m = _TIME_RE.search(msg)
+        reason_m = _REASON_RE.search(msg)
+        if not dates or not time_m:
+            return {"intent": "unknown"}
+        data = {
+            "intent": "clock_in_out",
+            "request_type": "Clock-In" if clock.group(1) == "in" else "Clock-Out",
+            "date": dates[0],
+            "time": time_m.group(1).replace("h", ":"),
+            "reason": reason_m.group(1) if reason_m else None,
+        }
+        data["date_normalized"] = normalize_relative_date(data["date"]) or data["date"]
+        return data
+
+    leave_type = _LEAVE_TYPE_RE.search(msg)
+    if leave_type and ("apply" in msg or "need" in msg or "want" in msg or "take" in msg):
+        if not dates:
+            return {"intent": "unknown"}
+        reason_m = _REASON_RE.search(msg)
+        data = {
+            "intent": "apply_leave",
+            "leave_type": leave_type.group(1),
+            "start_date": dates[0],
+            "end_date": dates[1] if len(dates) > 1 else dates[0],
+            "reason": reason_m.group(1) if reason_m else None,
+        }
+        for field in ("start_date", "end_date"):
+            data[f"{field}_normalized"] = normalize_relative_date(data[field]) or data[field]
+        return data
+
+    if _STATUS_RE.search(msg):
+        return {"intent": "view_leave_status"}
+
+    return {"intent": "unknown"}
+
+
+# Matches the intent field as soon as it streams in, well before the rest of
+# the JSON finishes decoding.
+_INTENT_FIELD_RE = re.compile(r'"intent"\s*:\s*"([a-z_]+)"')
+
+
+def _extract_json(s):
+    """Pull the first balanced JSON object out of s with a linear scan.
+
+    Fallback for content that is not a bare JSON document; unlike a greedy
+    ({.*}) regex this cannot backtrack pathologically.
+    """
+    i = s.find("{")
+    if i == -1:
+        return None
+    depth = 0
+    for j in range(i, len(s)):
+        c = s[j]
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return s[i:j + 1]
+    return None
+
 
-    prompt = f"""
-    You are an intent+entity extraction assistant for an ERP chatbot.
-    Return a strict JSON object with the following possible keys:
-    - intent (apply_leave, view_leave_status, clock_in_out, unknown)
-    - leave_type
-    - start_date
-    - end_date
-    - reason
-    - date
-    - time
-    - request_type
-
-    Examples:
-    {few_shot_examples}
-
-    User message: "{user_message}"
-    JSON:
+# In-flight extractions keyed by normalized query: concurrent duplicates
+# ("clock in" sent by many users in the same burst) await one shared result
+# instead of each paying an OpenAI call.
+_inflight = {}
+
+
+async def analyze_user_message(user_message, on_intent=None):
+    """Use GPT to detect intent and extract relevant entities.
+
+    Duplicate concurrent calls for the same normalized message are collapsed
+    into a single OpenAI request (single-flight).
     """
+    key = user_message.strip().lower()
+    fut = _inflight.get(key)
+    if fut is not None:
+        return dict(await fut)
 
-    payload = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}], "temperature": 0, "max_tokens": 200}
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
     try:
-        resp = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload, timeout=15)
-        resp.raise_for_status()
-        text = resp.json()["choices"][0]["message"]["content"].strip()
+        try:
+            ai_data = await _analyze_user_message_impl(user_message, on_intent)
+        except Exception as e:
+            # Degrade like the impl's own error paths; waiters share the
+            # fallback instead of seeing the leader's failure as their own.
+            print(f"[Intent Extraction Error]: {e}")
+            ai_data = {"intent": "unknown"}
+        fut.set_result(ai_data)
+        return ai_data
+    finally:
+        _inflight.pop(key, None)
+        if not fut.done():
+            # Only reachable when the leader itself was cancelled — resolve
+            # the shared future so waiters get a result, not CancelledError.
+            fut.set_result({"intent": "unknown"})
+
+
+async def _analyze_user_message_impl(user_message, on_intent=None):
+    """The uncollapsed extraction path behind the single-flight map.
+
+    The completion is streamed; when on_intent is given it is called with the
+    intent string the moment it appears, so callers can overlap downstream
+    I/O with the remaining decode.
+    """
+
+    # Short queries go through the semantic cache before spending a GPT call.
+    query_vec = None
+    if len(user_message) < _INTENT_CACHE_MAX_QUERY_LEN:
+        query_vec = await _embed(user_message.strip().lower())
+        if query_vec is not None:
+            cached = _intent_cache_lookup(query_vec)
+            if cached is not None:
+                return cached
+
+    payload = {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": _INTENT_SCHEMA_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
+        "temperature": 0,
+        "max_tokens": 120,
+        "response_format": {"type": "json_object"},
+        "stream": True,
+    }
+    try:
+        text = ""
+        intent_seen = False
+        async with _HTTPX.stream(
+            "POST", "https://api.openai.com/v1/chat/completions", headers=_OPENAI_HEADERS, json=payload, timeout=15
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                chunk = line[len("data: "):]
+                if chunk == "[DONE]":
+                    break
+                try:
+                    delta = _loads(chunk)["choices"][0]["delta"].get("content") or ""
+                except Exception:
+                    continue
+                text += delta
+                if on_intent is not None and not intent_seen:
+                    m = _INTENT_FIELD_RE.search(text)
+                    if m:
+                        intent_seen = True
+                        on_intent(m.group(1))
     except Exception as e:
         print(f"[Intent Extraction Error]: {e}")
         return {"intent": "unknown"}
 
-    match = re.search(r"(\{.*\})", text, re.S)
-    json_text = match.group(1) if match else text
-
+    # JSON mode guarantees a bare object, so parse directly; if the content
+    # is ever wrapped anyway, fall back to the linear brace scan.
     try:
-        ai_data = json.loads(json_text)
+        ai_data = _loads(text)
     except Exception:
-        ai_data = {"intent": "unknown"}
+        extracted = _extract_json(text)
+        try:
+            ai_data = _loads(extracted) if extracted else {"intent": "unknown"}
+        except Exception:
+            ai_data = {"intent": "unknown"}
 
     # Normalize date/time and fill fallbacks
     for field in ["start_date", "end_date", "date"]:
@@ -163,13 +464,57 @@ def analyze_user_message(user_message):
             ai_data[f"{field}_normalized"] = nd or ai_data[field]
 
     ai_data = fallback_extract(ai_data, user_message)
+    if query_vec is not None and ai_data.get("intent") != "unknown":
+        _intent_cache_add(query_vec, ai_data)
     return ai_data
 
 
 # ==============================================
 #  Module Handlers
 # ==============================================
-def handle_leave_auto(ai_data):
+# Short per-user TTL cache for the leave list, so repeated "show my leaves"
+# within a session only hit the backend once. Invalidated when the same user
+# applies for leave so fresh requests show up immediately.
+_LEAVE_CACHE_TTL = 30.0
+_LEAVE_CACHE_MAX = 1024
+_leave_cache = OrderedDict()  # user_id -> (fetched_at, leaves)
+
+
+def _leave_cache_get(user_id):
+    entry = _leave_cache.get(user_id)
+    if entry is not None and time.monotonic() - entry[0] < _LEAVE_CACHE_TTL:
+        _leave_cache.move_to_end(user_id)
+        return entry[1]
+    return None
+
+
+def _leave_cache_put(user_id, leaves):
+    _leave_cache[user_id] = (time.monotonic(), leaves)
+    _leave_cache.move_to_end(user_id)
+    while len(_leave_cache) > _LEAVE_CACHE_MAX:
+        _leave_cache.popitem(last=False)
+
+
+def _leave_cache_invalidate(user_id):
+    _leave_cache.pop(user_id, None)
+
+
+async def _fetch_leaves():
+    """GET the leave list from the backend."""
+    resp = await _HTTPX.get(f"{LEAVE_BASE_URL}/Leave", headers=_AUTH_HEADERS, timeout=10)
+    return _loads(resp.content)
+
+
+async def _post_backend(url, payload):
+    """POST to the backend, returning parsed JSON or an error dict."""
+    try:
+        resp = await _HTTPX.post(url, headers=_AUTH_HEADERS, json=payload, timeout=10)
+        return _loads(resp.content)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def handle_leave_auto(ai_data, user_id="anon"):
     """Apply leave automatically or ask for missing details."""
     leave_type = ai_data.get("leave_type")
     start_date = ai_data.get("start_date_normalized") or ai_data.get("start_date")
@@ -178,20 +523,26 @@ def handle_leave_auto(ai_data):
 
     missing = [f for f in ["leave_type", "start_date", "end_date", "reason"] if not ai_data.get(f)]
     if missing:
-        return jsonify({"message": f"Please provide {', '.join(missing)} to apply for leave."})
+        return {"message": f"Please provide {', '.join(missing)} to apply for leave."}
 
     payload = {"leave_type": leave_type, "begin_date": start_date, "end_date": end_date, "reason": reason}
-    try:
-        resp = requests.post(f"{LEAVE_BASE_URL}/Leave", headers=_auth_headers(), json=payload, timeout=10)
-        backend_data = resp.json()
-    except Exception as e:
-        backend_data = {"error": str(e)}
-
-    summary = get_openai_response(payload, "Leave Request")
-    return jsonify({"message": summary, "payload": payload, "backend_response": backend_data})
+    # The intent call already produced a confirmation; only pay for a second
+    # GPT round-trip if the model omitted it, and run that concurrently with
+    # the backend POST — the summary only needs the payload.
+    summary = ai_data.get("short_message")
+    if summary:
+        backend_data = await _post_backend(f"{LEAVE_BASE_URL}/Leave", payload)
+    else:
+        backend_data, summary = await asyncio.gather(
+            _post_backend(f"{LEAVE_BASE_URL}/Leave", payload),
+            get_openai_response(payload, "Leave Request"),
+        )
+    if not (isinstance(backend_data, dict) and backend_data.get("error")):
+        _leave_cache_invalidate(user_id)
+    return {"message": summary, "payload": payload, "backend_response": backend_data}
 
 
-def handle_clock_auto(ai_data):
+async def handle_clock_auto(ai_data):
     """Clock in/out automatically or ask for missing details."""
     date = ai_data.get("date_normalized") or ai_data.get("date")
     time = ai_data.get("time")
@@ -200,53 +551,105 @@ def handle_clock_auto(ai_data):
 
     missing = [f for f in ["date", "time", "request_type", "reason"] if not ai_data.get(f)]
     if missing:
-        return jsonify({"message": f"Please provide {', '.join(missing)} for clock request."})
+        return {"message": f"Please provide {', '.join(missing)} for clock request."}
 
     payload = {"date": date, "time": time, "request_type": request_type, "reason": reason}
-    try:
-        resp = requests.post(f"{CLOCK_BASE_URL}/ClockIn", headers=_auth_headers(), json=payload, timeout=10)
-        backend_data = resp.json()
-    except Exception as e:
-        backend_data = {"error": str(e)}
-
-    summary = get_openai_response(payload, "Clock Request")
-    return jsonify({"message": summary, "payload": payload, "backend_response": backend_data})
+    summary = ai_data.get("short_message")
+    if summary:
+        backend_data = await _post_backend(f"{CLOCK_BASE_URL}/ClockIn", payload)
+    else:
+        backend_data, summary = await asyncio.gather(
+            _post_backend(f"{CLOCK_BASE_URL}/ClockIn", payload),
+            get_openai_response(payload, "Clock Request"),
+        )
+    return {"message": summary, "payload": payload, "backend_response": backend_data}
 
 
 # ==============================================
 #  Chat Endpoint
 # ==============================================
-@app.route("/chat", methods=["POST"])
-def chat_ai_router():
-    data = request.get_json(force=True) or {}
-    user_message = (data.get("message") or "").strip()
-    if not user_message:
-        return jsonify({"error": "Message is required"}), 400
-
-    ai_data = analyze_user_message(user_message)
+async def _process_message(user_message, user_id="anon"):
+    """Route one chat message end to end; shared by /chat and /chat/batch."""
+    # Try the local classifier first; only fall back to GPT when it can't
+    # resolve the message.
+    ai_data = fast_intent(user_message)
+    early_tasks = {}
+    if ai_data.get("intent") == "unknown":
+        # Fire status-only backend work as soon as the streamed intent token
+        # arrives, overlapping it with the rest of the GPT decode.
+        def _on_intent(intent):
+            if intent == "view_leave_status":
+                early_tasks["leaves"] = asyncio.create_task(_fetch_leaves())
+
+        ai_data = await analyze_user_message(user_message, on_intent=_on_intent)
     intent = ai_data.get("intent", "unknown")
 
+    if intent != "view_leave_status" and "leaves" in early_tasks:
+        early_tasks["leaves"].cancel()
+
     if intent == "apply_leave":
-        return handle_leave_auto(ai_data)
+        return await handle_leave_auto(ai_data, user_id=user_id)
     elif intent == "view_leave_status":
         try:
-            resp = requests.get(f"{LEAVE_BASE_URL}/Leave", headers=_auth_headers(), timeout=10)
-            leaves = resp.json()
-            summary = get_openai_response({"total_leaves": len(leaves)}, "Leave Status")
-            return jsonify({"message": summary, "leaves": leaves})
+            leaves_task = early_tasks.get("leaves")
+            leaves = _leave_cache_get(user_id)
+            if leaves is not None:
+                if leaves_task is not None:
+                    leaves_task.cancel()
+            else:
+                leaves = await leaves_task if leaves_task is not None else await _fetch_leaves()
+                _leave_cache_put(user_id, leaves)
+            # The status summary is deterministic — no need to pay a GPT
+            # round-trip to phrase a count.
+            summary = f"You have {len(leaves)} leave request{'s' if len(leaves) != 1 else ''} on record."
+            return {"message": summary, "leaves": leaves}
         except Exception as e:
-            return jsonify({"message": f"Error fetching leave status: {str(e)}"})
+            return {"message": f"Error fetching leave status: {str(e)}"}
     elif intent == "clock_in_out":
-        return handle_clock_auto(ai_data)
+        return await handle_clock_auto(ai_data)
     else:
-        return jsonify({"message": "Sorry, we don’t have this feature yet."})
+        return {"message": "Sorry, we don’t have this feature yet."}
+
+
+@app.post("/chat")
+async def chat_ai_router(chat_request: ChatRequest):
+    user_message = chat_request.message.strip()
+    if not user_message:
+        raise HTTPException(status_code=400, detail="Message is required")
+    return await _process_message(user_message, user_id=chat_request.user_id)
+
+
+class BatchChatRequest(BaseModel):
+    """Request body for the batch chat endpoint"""
+    messages: list[str]
+    user_id: str = "anon"
+
+
+# Bounds how many messages of a batch run against OpenAI/backend at once.
+_BATCH_MAX_CONCURRENCY = 8
+
+
+@app.post("/chat/batch")
+async def chat_batch(batch_request: BatchChatRequest):
+    """Process several messages concurrently over the shared client/caches."""
+    semaphore = asyncio.Semaphore(_BATCH_MAX_CONCURRENCY)
+
+    async def _one(message):
+        async with semaphore:
+            message = message.strip()
+            if not message:
+                return {"error": "Message is required"}
+            return await _process_message(message, user_id=batch_request.user_id)
+
+    results = await asyncio.gather(*(_one(m) for m in batch_request.messages))
+    return {"results": results}
 
 
 # ==============================================
 #  Neural Network Interface (Conceptual)
 # ==============================================
-@app.route("/nn_interface", methods=["GET"])
-def neural_network_interface():
+@app.get("/nn_interface")
+async def neural_network_interface():
     nn_flow = {
         "input_layer": "User message embeddings",
         "hidden_layers": [
@@ -257,13 +660,16 @@ def neural_network_interface():
         "output_layer": "Predicted intent + extracted entities",
         "model_used": "gpt-4o-mini (Transformer Neural Network)"
     }
-    return jsonify(nn_flow)
+    return nn_flow
 
 #  Health Check
 # ==============================================
-@app.route("/health", methods=["GET"])
-def health():
-    return jsonify({"status": "ok"})
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    import uvicorn
+    # Production entrypoint: multiple workers need the import-string form.
+    # Equivalent CLI: uvicorn chatbot:app --workers 4 --loop uvloop --http httptools
+    uvicorn.run("chatbot:app", host="0.0.0.0", port=8000, workers=4, loop="uvloop", http="httptools")
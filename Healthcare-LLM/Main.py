@@ -1,8 +1,10 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List
 import os
+import json
 from dotenv import load_dotenv
 
 from app.services.llm_service import LLMService
@@ -41,6 +43,12 @@ async def root():
     }
 
 
+@app.get("/api/metrics")
+async def metrics():
+    """Accumulated LLM token usage and prompt-cache counters"""
+    return llm_service.usage_metrics()
+
+
 @app.post("/api/analyze", response_model=AnalysisResponse)
 async def analyze_report(file: UploadFile = File(...)):
     """
@@ -72,7 +80,7 @@ async def analyze_report(file: UploadFile = File(...)):
             )
         
         # Analyze with LLM
-        analysis = llm_service.analyze_medical_report(extracted_text)
+        analysis = await llm_service.analyze_medical_report(extracted_text)
         
         return analysis
         
@@ -92,7 +100,7 @@ async def chat(request: ChatRequest):
         AI-generated response
     """
     try:
-        response = llm_service.chat(
+        response = await llm_service.chat(
             message=request.message,
             context=request.context,
             conversation_history=request.conversation_history
@@ -104,6 +112,33 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Chat with the health assistant, streaming the response as SSE
+    
+    Args:
+        request: Chat message and optional context
+    
+    Returns:
+        text/event-stream of delta events, then a final event with the
+        full response and suggested follow-up questions
+    """
+    async def event_stream():
+        async for item in llm_service.chat_stream(
+            message=request.message,
+            context=request.context,
+            conversation_history=request.conversation_history
+        ):
+            if isinstance(item, str):
+                yield f"data: {json.dumps({'delta': item})}\n\n"
+            else:
+                yield f"data: {item.model_dump_json()}\n\n"
+        yield "data: [DONE]\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/api/explain-term")
 async def explain_medical_term(term: str):
     """
@@ -116,7 +151,7 @@ async def explain_medical_term(term: str):
         Simple explanation
     """
     try:
-        explanation = llm_service.explain_medical_term(term)
+        explanation = await llm_service.explain_medical_term(term)
         return {"term": term, "explanation": explanation}
         
     except Exception as e:
@@ -147,7 +182,7 @@ async def compare_reports(
         text2 = report_parser.extract_text(content2, file2.content_type)
         
         # Compare using LLM
-        comparison = llm_service.compare_reports(text1, text2)
+        comparison = await llm_service.compare_reports(text1, text2)
         
         return comparison
         
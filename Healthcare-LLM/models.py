@@ -21,6 +21,23 @@ class HealthInsight(BaseModel):
     reasoning: str
 
 
+class TermExplanation(BaseModel):
+    """One explained term; strict structured outputs cannot emit free-form dicts"""
+    term: str
+    explanation: str
+
+
+class AnalysisPayload(BaseModel):
+    """LLM-facing analysis schema, without the server-side response fields"""
+    report_type: str
+    patient_friendly_summary: str
+    key_findings: List[HealthMetric]
+    health_insights: List[HealthInsight]
+    risk_factors: List[str]
+    positive_indicators: List[str]
+    medical_terminology_explained: List[TermExplanation]
+
+
 class AnalysisResponse(BaseModel):
     """Response from report analysis"""
     report_type: str
@@ -1,41 +1,44 @@
-"""Prompt templates for LLM interactions"""
+"""Prompt templates for LLM interactions
 
-ANALYSIS_PROMPT = """
-You are a medical AI assistant analyzing a patient's medical report. Your goal is to help patients understand their health data in simple, accessible language.
+The large instruction/schema blocks are kept fully static and sent before any
+variable content (report text, terms): OpenAI's automatic prompt caching only
+applies to an exact prefix match, so putting variable text first would defeat
+it on every request.
+"""
 
-Medical Report:
-{report_text}
+ANALYSIS_PROMPT_STATIC = """
+You are a medical AI assistant analyzing a patient's medical report. Your goal is to help patients understand their health data in simple, accessible language.
 
-Please analyze this report and provide a JSON response with the following structure:
+The report will be provided in the next message. Please analyze it and provide a JSON response with the following structure:
 
-{{
+{
     "report_type": "type of report (e.g., Blood Test, Lipid Panel, Metabolic Panel)",
     "patient_friendly_summary": "A 2-3 paragraph summary in simple language explaining what this report shows about the patient's health. Avoid medical jargon.",
     "key_findings": [
-        {{
+        {
             "name": "Test name",
             "value": "Test value",
             "unit": "Unit of measurement",
             "normal_range": "Normal range for this test",
             "status": "normal/high/low/critical",
             "interpretation": "What this means in simple terms"
-        }}
+        }
     ],
     "health_insights": [
-        {{
+        {
             "category": "diet/exercise/medication/lifestyle",
             "priority": "high/medium/low",
             "recommendation": "Specific actionable recommendation",
             "reasoning": "Why this recommendation is important"
-        }}
+        }
     ],
     "risk_factors": ["List of any concerning findings or risk factors"],
     "positive_indicators": ["List of positive health indicators"],
-    "medical_terminology_explained": {{
+    "medical_terminology_explained": {
         "technical_term_1": "simple explanation",
         "technical_term_2": "simple explanation"
-    }}
-}}
+    }
+}
 
 Important guidelines:
 1. Use simple, patient-friendly language
@@ -47,6 +50,10 @@ Important guidelines:
 7. Focus on what the patient can understand and act upon
 """
 
+# Variable content is appended by concatenation; the placeholders were split
+# out at import time so no format-string parsing happens per call.
+ANALYSIS_REPORT_PREFIX = "REPORT:\n"
+
 CHAT_PROMPT = """
 You are a compassionate health assistant helping patients understand their medical reports and health questions.
 
@@ -59,13 +66,11 @@ Guidelines:
 6. If asked about serious symptoms, encourage seeking immediate medical attention
 7. Reference the report context when available
 
-Remember: You're here to educate and support, not to replace professional medical advice.
+Remember: You're here to educate and support, not to replace professional medical advice. Respond in under 150 words.
 """
 
-TERM_EXPLANATION_PROMPT = """
-Explain the following medical term in simple, everyday language that a patient without medical training can understand:
-
-Term: {term}
+TERM_EXPLANATION_PROMPT_STATIC = """
+Explain the medical term given in the next message in simple, everyday language that a patient without medical training can understand.
 
 Provide:
 1. A simple definition (2-3 sentences)
@@ -73,27 +78,23 @@ Provide:
 3. Common contexts where this appears
 4. Any relevant normal ranges or values if applicable
 
-Keep it conversational and accessible.
+Keep it conversational and accessible, and keep the explanation under 120 words.
 """
 
-COMPARISON_PROMPT = """
-You are analyzing two medical reports from the same patient taken at different times. Identify trends, improvements, and areas of concern.
-
-Earlier Report:
-{report1}
+TERM_PREFIX = "Term: "
 
-Recent Report:
-{report2}
+COMPARISON_PROMPT_STATIC = """
+You are analyzing two medical reports from the same patient taken at different times. Identify trends, improvements, and areas of concern.
 
-Provide a JSON response with the following structure:
+The earlier and recent reports will be provided in the next message. Provide a JSON response with the following structure:
 
-{{
+{
     "improvements": ["List specific metrics or values that have improved"],
     "deteriorations": ["List specific metrics or values that have worsened"],
     "stable_metrics": ["List metrics that remained stable"],
     "trend_analysis": "A comprehensive 2-3 paragraph analysis of the overall health trends",
     "recommendations": ["Specific recommendations based on the trends observed"]
-}}
+}
 
 Focus on:
 1. Significant changes in values
@@ -102,6 +103,9 @@ Focus on:
 4. Lifestyle factors that may have contributed to changes
 """
 
+COMPARISON_EARLIER_PREFIX = "Earlier Report:\n"
+COMPARISON_RECENT_PREFIX = "\n\nRecent Report:\n"
+
 MEDICAL_KNOWLEDGE_BASE = """
 Common Medical Tests and Normal Ranges:
 
@@ -1,25 +1,260 @@
 import os
-import json
-from typing import List, Optional
-from openai import OpenAI
+import re
+import time
+import asyncio
+import hashlib
+import httpx
+import orjson
+import tiktoken
+from typing import Dict, List, Optional
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, RateLimitError
+from pydantic import TypeAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 from app.models import (
-    AnalysisResponse, ChatResponse, ChatMessage, 
+    AnalysisResponse, AnalysisPayload, ChatResponse, ChatMessage, 
     HealthMetric, HealthInsight, ReportComparison
 )
 from app.utils.prompts import (
-    ANALYSIS_PROMPT, CHAT_PROMPT, TERM_EXPLANATION_PROMPT,
-    COMPARISON_PROMPT
+    ANALYSIS_PROMPT_STATIC, ANALYSIS_REPORT_PREFIX, CHAT_PROMPT,
+    TERM_EXPLANATION_PROMPT_STATIC, TERM_PREFIX,
+    COMPARISON_PROMPT_STATIC, COMPARISON_EARLIER_PREFIX, COMPARISON_RECENT_PREFIX
 )
 
+# One tuned connection pool for every LLMService instance: per-instance
+# clients would each open their own pool, repeating TLS handshakes and
+# defeating HTTP/2 multiplexing across concurrent calls.
+_HTTP_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=5.0)
+)
+_OPENAI_CLIENTS = {}
+
+
+def _shared_openai_client(api_key: str) -> AsyncOpenAI:
+    """One AsyncOpenAI client per key, all sharing the tuned HTTP pool"""
+    client = _OPENAI_CLIENTS.get(api_key)
+    if client is None:
+        # SDK retries are disabled: tenacity owns the retry policy, and two
+        # stacked backoff layers would multiply attempts and hide failures
+        # from the circuit breaker.
+        client = AsyncOpenAI(api_key=api_key, http_client=_HTTP_CLIENT, max_retries=0)
+        _OPENAI_CLIENTS[api_key] = client
+    return client
+
+
+# Shape outgoing traffic to the org quota instead of bursting into 429s
+_RATE_LIMITER = AsyncLimiter(int(os.getenv("OPENAI_RPM", "300")), 60)
+
+# Retry only transient failures, with jittered exponential backoff
+_llm_retry = retry(
+    wait=wait_exponential_jitter(1, 30),
+    retry=retry_if_exception_type((RateLimitError, APITimeoutError, APIConnectionError)),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+
+class _CircuitBreaker:
+    """Fail fast while the API is persistently erroring
+
+    Queueing retries behind a dead upstream amplifies tail latency for every
+    caller; after a run of failures the breaker rejects calls outright until
+    a cooldown elapses.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        if self._failures < self.threshold:
+            return True
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            # Half-open: let one attempt probe the upstream
+            self._failures = self.threshold - 1
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._opened_at = time.monotonic()
+
+
+_BREAKER = _CircuitBreaker()
+
+
+# Topic patterns driving follow-up suggestions; compiled once. Question
+# suggestion is deterministic enough that an LLM round-trip per chat turn
+# is not worth its latency or cost.
+_FOLLOW_UP_TOPICS = [
+    (re.compile(r"\b(cholesterol|ldl|hdl|triglycerides?|lipid)\b"),
+     "What foods help improve my cholesterol levels?"),
+    (re.compile(r"\b(glucose|blood sugar|a1c|diabet\w+)\b"),
+     "How can I keep my blood sugar in a healthy range?"),
+    (re.compile(r"\b(hemoglobin|an[ae]mia|iron)\b"),
+     "What can I do to improve my iron levels?"),
+    (re.compile(r"\b(blood pressure|hypertension)\b"),
+     "What lifestyle changes help lower blood pressure?"),
+    (re.compile(r"\b(thyroid|tsh)\b"),
+     "What symptoms should I watch for with thyroid issues?"),
+    (re.compile(r"\b(liver|alt|ast|bilirubin)\b"),
+     "How can I support my liver health?"),
+]
+
+
+# Built once: list validation dispatches to the Rust core in a single call
+# instead of running full Python-level validation per item.
+_HEALTH_METRICS_ADAPTER = TypeAdapter(List[HealthMetric])
+_HEALTH_INSIGHTS_ADAPTER = TypeAdapter(List[HealthInsight])
+
 
 class LLMService:
     """Service for interacting with LLM for medical analysis"""
-    
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        self.client = OpenAI(api_key=api_key)
+
+    TERM_CACHE_TTL = 24 * 3600
+    ANALYSIS_CACHE_TTL = 4 * 3600
+    HISTORY_TOKEN_BUDGET = 2000
+    MAX_REPORT_TOKENS = 8000
+    REPORT_CHUNK_TOKENS = 4000
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        fast_model: str = "gpt-4o-mini",
+        provider: str = "openai"
+    ):
+        self.client = _shared_openai_client(api_key)
         self.model = model
-    
-    def analyze_medical_report(self, report_text: str) -> AnalysisResponse:
+        # Latency-tolerant, low-risk calls (term explanations, follow-up
+        # suggestions) run on the cheap model under the flex service tier;
+        # report analysis keeps the default tier and quality model.
+        self.fast_model = fast_model
+        # "anthropic" when pointed at Claude via an OpenAI-compatible proxy;
+        # those backends need explicit cache_control markers to cache prompts.
+        self.provider = provider
+        # Response caches: term explanations are stable for a day, full
+        # analyses for a few hours. An optional Redis tier (REDIS_URL) shares
+        # hits across workers; the in-process TTLCache answers first.
+        self._term_cache = TTLCache(maxsize=10_000, ttl=self.TERM_CACHE_TTL)
+        self._analysis_cache = TTLCache(maxsize=10_000, ttl=self.ANALYSIS_CACHE_TTL)
+        try:
+            self._encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding("cl100k_base")
+        self._usage = {
+            "requests": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cached_prompt_tokens": 0
+        }
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.from_url(redis_url, decode_responses=True)
+
+    def _cacheable(self, text: str):
+        """
+        Mark static prompt text as cacheable
+
+        OpenAI caches matching prefixes automatically; Anthropic-compatible
+        backends only cache content blocks carrying an explicit
+        cache_control breakpoint.
+        """
+        if self.provider == "anthropic":
+            return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+        return text
+
+    @_llm_retry
+    async def _create(self, **kwargs):
+        """Rate-limited, circuit-broken chat.completions.create"""
+        if not _BREAKER.allow():
+            raise RuntimeError("LLM circuit breaker open; retry later")
+        async with _RATE_LIMITER:
+            try:
+                result = await self.client.chat.completions.create(**kwargs)
+            except Exception:
+                _BREAKER.record_failure()
+                raise
+        _BREAKER.record_success()
+        return result
+
+    @_llm_retry
+    async def _parse(self, **kwargs):
+        """Rate-limited, circuit-broken beta.chat.completions.parse"""
+        if not _BREAKER.allow():
+            raise RuntimeError("LLM circuit breaker open; retry later")
+        async with _RATE_LIMITER:
+            try:
+                result = await self.client.beta.chat.completions.parse(**kwargs)
+            except Exception:
+                _BREAKER.record_failure()
+                raise
+        _BREAKER.record_success()
+        return result
+
+    def _cache_key(self, kind: str, text: str) -> str:
+        """Stable cache key over model + normalized input"""
+        digest = hashlib.sha256(f"{self.model}:{kind}:{text.strip().lower()}".encode()).hexdigest()
+        return f"llm:{kind}:{digest}"
+
+    async def _cache_get(self, cache: TTLCache, key: str) -> Optional[str]:
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if self._redis is not None:
+            try:
+                value = await self._redis.get(key)
+            except Exception:
+                return None
+            if value is not None:
+                cache[key] = value
+        return value
+
+    async def _cache_set(self, cache: TTLCache, key: str, value: str, ttl: int) -> None:
+        cache[key] = value
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, value, ex=ttl)
+            except Exception:
+                pass
+
+    def _record_usage(self, response) -> None:
+        """
+        Accumulate token usage and prompt-cache activity from a response
+
+        Counters feed the /api/metrics endpoint; without them there is no
+        way to tell whether prompt caching and the response caches are
+        actually paying off in production.
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        self._usage["requests"] += 1
+        self._usage["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+        self._usage["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+        # OpenAI reports served-from-cache prompt tokens in a details block
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", 0) or 0 if details is not None else 0
+        # Anthropic-compatible backends report cache writes/reads directly
+        read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        self._usage["cached_prompt_tokens"] += cached + read
+
+    def usage_metrics(self) -> Dict[str, int]:
+        """Snapshot of the accumulated token and cache counters"""
+        return dict(self._usage)
+
+    async def analyze_medical_report(self, report_text: str) -> AnalysisResponse:
         """
         Analyze a medical report using LLM
         
@@ -29,46 +264,199 @@ class LLMService:
         Returns:
             Structured analysis response
         """
-        prompt = ANALYSIS_PROMPT.format(report_text=report_text)
+        cache_key = self._cache_key("analysis", report_text)
+        cached = await self._cache_get(self._analysis_cache, cache_key)
+        if cached is not None:
+            return AnalysisResponse.model_validate_json(cached)
+
+        # Structured Outputs: the model emits exactly the AnalysisPayload
+        # schema, so no JSON repair or manual model construction is needed.
+        analysis_text = await self._condense_if_long(report_text)
+        request = self._analysis_request(analysis_text)
+        request["response_format"] = AnalysisPayload
+        response = await self._parse(**request)
         
-        response = self.client.chat.completions.create(
-            model=self.model,
+        self._record_usage(response)
+        payload = response.choices[0].message.parsed
+        
+        analysis = AnalysisResponse(
+            report_type=payload.report_type,
+            original_text=report_text,
+            patient_friendly_summary=payload.patient_friendly_summary,
+            key_findings=payload.key_findings,
+            health_insights=payload.health_insights,
+            risk_factors=payload.risk_factors,
+            positive_indicators=payload.positive_indicators,
+            medical_terminology_explained={
+                t.term: t.explanation for t in payload.medical_terminology_explained
+            }
+        )
+        await self._cache_set(self._analysis_cache, cache_key, analysis.model_dump_json(), self.ANALYSIS_CACHE_TTL)
+        return analysis
+
+    async def _condense_if_long(self, report_text: str) -> str:
+        """
+        Cap the token cost of a report before full analysis
+
+        Very long reports (multi-page hospital discharge summaries) blow the
+        prompt budget and slow the quality model down. Past MAX_REPORT_TOKENS
+        the text is split into REPORT_CHUNK_TOKENS-sized chunks, the cheap
+        model extracts the key clinical values from each chunk in parallel,
+        and the merged compact JSON stands in for the raw text.
+        """
+        tokens = self._encoding.encode(report_text)
+        if len(tokens) <= self.MAX_REPORT_TOKENS:
+            return report_text
+
+        chunks = [
+            self._encoding.decode(tokens[start:start + self.REPORT_CHUNK_TOKENS])
+            for start in range(0, len(tokens), self.REPORT_CHUNK_TOKENS)
+        ]
+        extractions = await asyncio.gather(*(self._extract_chunk_values(c) for c in chunks))
+        merged = []
+        for extraction in extractions:
+            try:
+                merged.append(orjson.loads(extraction))
+            except orjson.JSONDecodeError:
+                continue
+        return "Key clinical values extracted from the full report:\n" + orjson.dumps(merged).decode()
+
+    async def _extract_chunk_values(self, chunk: str) -> str:
+        """Cheap-model extraction of the clinical values in one report chunk"""
+        response = await self._create(
+            model=self.fast_model,
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a medical AI assistant that helps patients understand their medical reports. Provide accurate, compassionate, and easy-to-understand explanations."
+                    "content": self._cacheable(
+                        "Extract every clinical measurement from the report excerpt in the "
+                        "next message as a JSON object: test names as keys, and for each an "
+                        "object with value, unit, and normal_range when stated. Include any "
+                        "diagnoses or notable findings under a \"findings\" array. Output "
+                        "JSON only."
+                    )
                 },
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": chunk
                 }
             ],
-            temperature=0.3,  # Lower temperature for more consistent medical advice
+            temperature=0.0,
+            max_tokens=600,
             response_format={"type": "json_object"}
         )
-        
-        # Parse LLM response
-        analysis_data = json.loads(response.choices[0].message.content)
-        
-        # Convert to Pydantic models
+        return response.choices[0].message.content
+
+    def _analysis_request(self, report_text: str) -> dict:
+        """Request payload for one report analysis, shared with the batch path
+
+        Static instructions first, variable report last, so the long prefix
+        stays byte-identical across requests and prompt caching applies.
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": self._cacheable("You are a medical AI assistant that helps patients understand their medical reports. Provide accurate, compassionate, and easy-to-understand explanations.")
+                },
+                {
+                    "role": "user",
+                    "content": self._cacheable(ANALYSIS_PROMPT_STATIC)
+                },
+                {
+                    "role": "user",
+                    "content": ANALYSIS_REPORT_PREFIX + report_text
+                }
+            ],
+            "temperature": 0.3,  # Lower temperature for more consistent medical advice
+            # The full schema (summary paragraphs + 6 fields per metric on a
+            # 15+ metric panel) routinely exceeds a tight cap, and truncation
+            # on the structured-outputs path raises instead of degrading.
+            "max_tokens": 2000,
+            "response_format": {"type": "json_object"}
+        }
+
+    def _build_analysis(self, analysis_data: dict, report_text: str) -> AnalysisResponse:
+        """Convert a parsed analysis payload to Pydantic models"""
         return AnalysisResponse(
             report_type=analysis_data.get("report_type", "Unknown"),
             original_text=report_text,
             patient_friendly_summary=analysis_data.get("patient_friendly_summary", ""),
-            key_findings=[
-                HealthMetric(**finding) 
-                for finding in analysis_data.get("key_findings", [])
-            ],
-            health_insights=[
-                HealthInsight(**insight)
-                for insight in analysis_data.get("health_insights", [])
-            ],
+            key_findings=_HEALTH_METRICS_ADAPTER.validate_python(
+                analysis_data.get("key_findings", [])
+            ),
+            health_insights=_HEALTH_INSIGHTS_ADAPTER.validate_python(
+                analysis_data.get("health_insights", [])
+            ),
             risk_factors=analysis_data.get("risk_factors", []),
             positive_indicators=analysis_data.get("positive_indicators", []),
             medical_terminology_explained=analysis_data.get("medical_terminology_explained", {})
         )
+
+    async def analyze_medical_reports_batch(
+        self,
+        reports: List[str],
+        poll_interval: float = 60.0
+    ) -> List[Optional[AnalysisResponse]]:
+        """
+        Analyze many reports through the OpenAI Batch API
+        
+        Bulk jobs (nightly cohort analyses, historical re-processing) run at
+        half the on-demand price and without per-request HTTP overhead.
+        
+        Args:
+            reports: Extracted text of each report
+            poll_interval: Seconds between batch status polls
+        
+        Returns:
+            Analyses in input order; None where an individual request failed
+        """
+        lines = []
+        for i, report_text in enumerate(reports):
+            lines.append(orjson.dumps({
+                "custom_id": f"rep-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._analysis_request(report_text)
+            }).decode())
+        
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+        
+        output = await self.client.files.content(batch.output_file_id)
+        results: List[Optional[AnalysisResponse]] = [None] * len(reports)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = orjson.loads(line)
+            idx = int(entry["custom_id"].split("-", 1)[1])
+            if entry.get("error") or entry["response"]["status_code"] != 200:
+                continue
+            # A malformed or truncated completion must not discard the rest
+            # of an already-paid-for batch; the slot just stays None.
+            try:
+                content = entry["response"]["body"]["choices"][0]["message"]["content"]
+                results[idx] = self._build_analysis(orjson.loads(content), reports[idx])
+            except Exception:
+                continue
+        return results
     
-    def chat(
+    async def chat(
         self, 
         message: str, 
         context: Optional[str] = None,
@@ -85,11 +473,37 @@ class LLMService:
         Returns:
             AI response with suggestions
         """
-        # Build conversation messages
+        messages = self._chat_messages(message, context, conversation_history)
+        
+        response = await self._create(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=500
+        )
+        
+        self._record_usage(response)
+        response_text = response.choices[0].message.content
+
+        # Follow-ups come from keyword templates — microseconds, no LLM call
+        suggested_questions = self._generate_follow_up_questions(message, response_text)
+
+        return ChatResponse(
+            response=response_text,
+            suggested_questions=suggested_questions
+        )
+    
+    def _chat_messages(
+        self,
+        message: str,
+        context: Optional[str] = None,
+        conversation_history: Optional[List[ChatMessage]] = None
+    ) -> List[dict]:
+        """Build the message list for a chat turn, shared with the stream path"""
         messages = [
             {
                 "role": "system",
-                "content": CHAT_PROMPT
+                "content": self._cacheable(CHAT_PROMPT)
             }
         ]
         
@@ -100,37 +514,90 @@ class LLMService:
                 "content": f"Previous report context:\n{context}"
             })
         
-        # Add conversation history
+        # Add conversation history, newest-first within a token budget rather
+        # than a fixed last-6: input tokens drive both cost and latency.
         if conversation_history:
-            for msg in conversation_history[-6:]:  # Last 6 messages for context
+            kept: List[ChatMessage] = []
+            budget = self.HISTORY_TOKEN_BUDGET
+            for msg in reversed(conversation_history):
+                cost = len(self._encoding.encode(msg.content)) + 4  # message overhead
+                if cost > budget:
+                    break
+                budget -= cost
+                kept.append(msg)
+            kept.reverse()
+            
+            # Older turns that fell outside the budget are compacted into a
+            # short system note instead of being dropped silently.
+            dropped = conversation_history[:len(conversation_history) - len(kept)]
+            if dropped:
+                condensed = " | ".join(
+                    f"{m.role}: {m.content[:120]}" for m in dropped[-10:]
+                )
+                messages.append({
+                    "role": "system",
+                    "content": f"Earlier conversation (condensed): {condensed}"
+                })
+            
+            for msg in kept:
                 messages.append({
                     "role": msg.role,
                     "content": msg.content
                 })
         
+        # On Anthropic-compatible backends, a breakpoint on the last historical
+        # turn lets the whole conversation-so-far be served from cache.
+        if self.provider == "anthropic" and conversation_history and len(messages) > 1:
+            messages[-1]["content"] = self._cacheable(messages[-1]["content"])
+
         # Add current message
         messages.append({
             "role": "user",
             "content": message
         })
+        return messages
+
+    async def chat_stream(
+        self,
+        message: str,
+        context: Optional[str] = None,
+        conversation_history: Optional[List[ChatMessage]] = None
+    ):
+        """
+        Chat with the health assistant, streaming the reply
+        
+        Yields response text deltas as they decode, then a final ChatResponse
+        carrying the full text and suggested follow-up questions. Perceived
+        latency drops to time-to-first-token instead of full generation time.
+        """
+        messages = self._chat_messages(message, context, conversation_history)
         
-        response = self.client.chat.completions.create(
+        stream = await self._create(
             model=self.model,
             messages=messages,
-            temperature=0.7
+            temperature=0.7,
+            max_tokens=500,
+            stream=True,
+            stream_options={"include_usage": True}
         )
         
-        response_text = response.choices[0].message.content
+        parts = []
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content or ""
+                if delta:
+                    parts.append(delta)
+                    yield delta
+            elif getattr(chunk, "usage", None) is not None:
+                self._record_usage(chunk)
         
-        # Generate follow-up questions
-        suggested_questions = self._generate_follow_up_questions(message, response_text)
-        
-        return ChatResponse(
-            response=response_text,
-            suggested_questions=suggested_questions
+        full_text = "".join(parts)
+        yield ChatResponse(
+            response=full_text,
+            suggested_questions=self._generate_follow_up_questions(message, full_text)
         )
-    
-    def explain_medical_term(self, term: str) -> str:
+
+    async def explain_medical_term(self, term: str) -> str:
         """
         Explain a medical term in simple language
         
@@ -140,26 +607,97 @@ class LLMService:
         Returns:
             Simple explanation
         """
-        prompt = TERM_EXPLANATION_PROMPT.format(term=term)
-        
-        response = self.client.chat.completions.create(
-            model=self.model,
+        cache_key = self._cache_key("term", term)
+        cached = await self._cache_get(self._term_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self._create(
+            model=self.fast_model,
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a medical educator helping patients understand medical terminology."
+                    "content": self._cacheable("You are a medical educator helping patients understand medical terminology.")
+                },
+                {
+                    "role": "user",
+                    "content": self._cacheable(TERM_EXPLANATION_PROMPT_STATIC)
                 },
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": TERM_PREFIX + term
                 }
             ],
-            temperature=0.3
+            temperature=0.3,
+            max_tokens=200,
+            service_tier="flex"
         )
         
-        return response.choices[0].message.content
-    
-    def compare_reports(self, report1_text: str, report2_text: str) -> ReportComparison:
+        self._record_usage(response)
+        explanation = response.choices[0].message.content
+        await self._cache_set(self._term_cache, cache_key, explanation, self.TERM_CACHE_TTL)
+        return explanation
+
+    async def explain_medical_terms(self, terms: List[str]) -> Dict[str, str]:
+        """
+        Explain several medical terms in one completion call
+
+        A report commonly surfaces 5-10 unfamiliar terms; explaining them
+        one call each pays per-request overhead and the instruction prompt
+        N times. One call with a JSON array of terms returns all the
+        explanations for roughly the cost of a single request.
+
+        Args:
+            terms: Medical terms to explain
+
+        Returns:
+            Mapping of each term to its plain-language explanation
+        """
+        explanations: Dict[str, str] = {}
+        misses = []
+        for term in terms:
+            cached = await self._cache_get(self._term_cache, self._cache_key("term-short", term))
+            if cached is not None:
+                explanations[term] = cached
+            elif term not in misses:
+                misses.append(term)
+        if not misses:
+            return explanations
+
+        response = await self._create(
+            model=self.fast_model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": self._cacheable(
+                        "You will receive a JSON array of medical terms. Respond with a "
+                        "JSON object mapping each term to a plain-English explanation of "
+                        "30 words or less that a patient without medical training can understand."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": orjson.dumps(misses).decode()
+                }
+            ],
+            temperature=0.3,
+            max_tokens=len(misses) * 60,
+            response_format={"type": "json_object"}
+        )
+
+        self._record_usage(response)
+        parsed = orjson.loads(response.choices[0].message.content)
+        for term in misses:
+            explanation = parsed.get(term)
+            if explanation:
+                explanations[term] = explanation
+                await self._cache_set(
+                    self._term_cache, self._cache_key("term-short", term),
+                    explanation, self.TERM_CACHE_TTL
+                )
+        return explanations
+
+    async def compare_reports(self, report1_text: str, report2_text: str) -> ReportComparison:
         """
         Compare two medical reports to identify trends
         
@@ -170,37 +708,54 @@ class LLMService:
         Returns:
             Comparison analysis
         """
-        prompt = COMPARISON_PROMPT.format(
-            report1=report1_text,
-            report2=report2_text
-        )
-        
-        response = self.client.chat.completions.create(
+        cache_key = self._cache_key("comparison", report1_text + "\x00" + report2_text)
+        cached = await self._cache_get(self._analysis_cache, cache_key)
+        if cached is not None:
+            return ReportComparison.model_validate_json(cached)
+
+        response = await self._parse(
             model=self.model,
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a medical AI analyzing trends in patient health reports."
+                    "content": self._cacheable("You are a medical AI analyzing trends in patient health reports.")
+                },
+                {
+                    "role": "user",
+                    "content": self._cacheable(COMPARISON_PROMPT_STATIC)
                 },
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": COMPARISON_EARLIER_PREFIX + report1_text + COMPARISON_RECENT_PREFIX + report2_text
                 }
             ],
             temperature=0.3,
-            response_format={"type": "json_object"}
+            max_tokens=1500,
+            response_format=ReportComparison
         )
         
-        comparison_data = json.loads(response.choices[0].message.content)
-        
-        return ReportComparison(**comparison_data)
+        self._record_usage(response)
+        comparison = response.choices[0].message.parsed
+        await self._cache_set(self._analysis_cache, cache_key, comparison.model_dump_json(), self.ANALYSIS_CACHE_TTL)
+        return comparison
     
     def _generate_follow_up_questions(self, user_message: str, ai_response: str) -> List[str]:
-        """Generate relevant follow-up questions"""
-        # Simple implementation - can be enhanced with another LLM call
-        questions = [
+        """Suggest follow-up questions from topics mentioned in the exchange"""
+        text = f"{user_message} {ai_response}".lower()
+        questions = []
+        for pattern, question in _FOLLOW_UP_TOPICS:
+            if pattern.search(text):
+                questions.append(question)
+                if len(questions) == 3:
+                    return questions
+        
+        # Pad with general defaults when few topics matched
+        for question in (
             "What lifestyle changes can I make to improve these results?",
             "Should I be concerned about any of these findings?",
             "How often should I get these tests done?"
-        ]
-        return questions[:3]
+        ):
+            if len(questions) == 3:
+                break
+            questions.append(question)
+        return questions